@@ -0,0 +1,58 @@
+"""Numba-compiled indexing kernels backing the helpers in `tensor_data`.
+
+These operate on raw integer arrays and do not check lengths. Use the
+wrappers in `tensor_data` from Python code; they validate their arguments and
+convert Python sequences to arrays first.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numba
+
+if TYPE_CHECKING:
+    from .tensor_data import Index, OutIndex, Shape, Strides
+
+
+@numba.njit(cache=True)
+def index_to_position(index: Index, strides: Strides) -> int:
+    """Compiled `tensor_data.index_to_position`."""
+    position = 0
+    for i in range(len(index)):
+        position += index[i] * strides[i]
+    return position
+
+
+@numba.njit(cache=True)
+def to_index(ordinal: int, shape: Shape, out_index: OutIndex) -> None:
+    """Compiled `tensor_data.to_index`."""
+    dims = len(shape)
+    if dims > 4:
+        for i in range(dims - 1, -1, -1):
+            ordinal, r = divmod(ordinal, shape[i])
+            out_index[i] = r
+        return
+
+    # Unrolled for the common small ranks, one divmod per dimension.
+    if dims >= 4:
+        ordinal, r = divmod(ordinal, shape[3])
+        out_index[3] = r
+    if dims >= 3:
+        ordinal, r = divmod(ordinal, shape[2])
+        out_index[2] = r
+    if dims >= 2:
+        ordinal, r = divmod(ordinal, shape[1])
+        out_index[1] = r
+    if dims >= 1:
+        out_index[0] = ordinal % shape[0]
+
+
+@numba.njit(cache=True)
+def broadcast_index(
+    big_index: Index, big_shape: Shape, shape: Shape, out_index: OutIndex
+) -> None:
+    """Compiled `tensor_data.broadcast_index`."""
+    pad_amount = len(big_shape) - len(shape)
+    for i in range(len(shape)):
+        out_index[i] = big_index[i + pad_amount] if shape[i] > 1 else 0
@@ -63,6 +63,11 @@ class Scalar:
     derivative: Optional[float] = None
     name: str = field(default="")
     unique_id: int = field(default=0)
+    # `(d_output, partials)` from the last `chain_rule` call. History and saved
+    # values never change after creation, so a repeated `d_output` reuses them.
+    _grad_cache: Optional[Tuple[float, Sequence[Tuple[Variable, Any]]]] = field(
+        default=None, init=False, repr=False
+    )
 
     def __post_init__(self):
         global _var_count
@@ -171,6 +176,10 @@ class Scalar:
             Iterable of tuples of the form (variable, local_gradient).
 
         """
+        cached = self._grad_cache
+        if cached is not None and cached[0] == d_output:
+            return cached[1]
+
         h = self.history
         assert h is not None
         assert h.last_fn is not None
@@ -184,7 +193,9 @@ class Scalar:
         paired_grads = zip(h.inputs, local_grads)
 
         # Filter out constants
-        return [(var, grad) for var, grad in paired_grads if not var.is_constant()]
+        result = [(var, grad) for var, grad in paired_grads if not var.is_constant()]
+        self._grad_cache = (d_output, result)
+        return result
 
     def backward(self, d_output: Optional[float] = None) -> None:
         """Calls autodiff to fill in the derivatives for the history of this object.
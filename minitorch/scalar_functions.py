@@ -21,6 +21,20 @@ def wrap_tuple(x: float | Tuple[float, ...]) -> Tuple[float, ...]:
     return (x,)
 
 
+# `minitorch.scalar` imports this module, so its classes are bound together on
+# first use in `ScalarFunction.apply` rather than looked up through the package
+# each call. Type checkers see the real classes.
+if TYPE_CHECKING:
+    from .scalar import Scalar as _Scalar
+    from .scalar import ScalarHistory as _ScalarHistory
+else:
+    _Scalar = _ScalarHistory = None
+
+# Shared by functions that save nothing for backward. `no_grad` makes
+# `save_for_backward` a no-op, so it can never pick up state.
+_EMPTY_CTX = Context(no_grad=True)
+
+
 class ScalarFunction:
     """A wrapper for a mathematical function that processes and produces
     Scalar variables.
@@ -29,6 +43,10 @@ class ScalarFunction:
     here to group together the `forward` and `backward` code.
     """
 
+    # Functions whose `backward` reads nothing from the context share
+    # `_EMPTY_CTX` instead of allocating their own.
+    STATELESS_BACKWARD: bool = False
+
     @classmethod
     def _backward(cls, ctx: Context, d_out: float) -> Tuple[float, ...]:
         return wrap_tuple(cls.backward(ctx, d_out))  # type: ignore
@@ -37,6 +55,16 @@ class ScalarFunction:
     def _forward(cls, ctx: Context, *inps: float) -> float:
         return cls.forward(ctx, *inps)  # type: ignore
 
+    @classmethod
+    def _forward_saving_residual(cls, ctx: Context, *inps: float) -> float:
+        # Functions that define `forward_residual(ctx, *inps) -> (out, residual)`
+        # hand back the local derivative alongside the output and implement
+        # `forward` with this helper. The residual is saved in place of the
+        # inputs so `backward` is a single multiply.
+        c, residual = cls.forward_residual(ctx, *inps)  # type: ignore
+        ctx.save_for_backward(residual)
+        return c
+
     @classmethod
     def apply(cls, *vals: ScalarLike) -> Scalar:
         """Apply the scalar function to the given values.
@@ -50,32 +78,44 @@ class ScalarFunction:
             The result of the scalar function.
 
         """
-        raw_vals = []
-        scalars = []
-        for v in vals:
-            if isinstance(v, minitorch.scalar.Scalar):
-                scalars.append(v)
-                raw_vals.append(v.data)
-            else:
-                scalars.append(minitorch.scalar.Scalar(v))
-                raw_vals.append(v)
-
-        # Create the context.
-        ctx = Context(False)
-
-        # Call forward with the variables.
+        global _Scalar, _ScalarHistory
+        if _Scalar is None:
+            _Scalar = minitorch.scalar.Scalar
+            _ScalarHistory = minitorch.scalar.ScalarHistory
+
+        # The unary and binary cases cover every built-in function and skip
+        # the loop.
+        n = len(vals)
+        if n == 1:
+            (a,) = vals
+            sa = a if isinstance(a, _Scalar) else _Scalar(a)
+            scalars = [sa]
+            raw_vals = [sa.data]
+        elif n == 2:
+            a, b = vals
+            sa = a if isinstance(a, _Scalar) else _Scalar(a)
+            sb = b if isinstance(b, _Scalar) else _Scalar(b)
+            scalars = [sa, sb]
+            raw_vals = [sa.data, sb.data]
+        else:
+            scalars = [v if isinstance(v, _Scalar) else _Scalar(v) for v in vals]
+            raw_vals = [sv.data for sv in scalars]
+
+        # Create the context and call forward with the variables.
+        ctx = _EMPTY_CTX if cls.STATELESS_BACKWARD else Context(False)
         c = cls._forward(ctx, *raw_vals)
-        assert isinstance(c, float), "Expected return type float got %s" % (type(c))
 
         # Create a new variable from the result with a new history.
-        back = minitorch.scalar.ScalarHistory(cls, ctx, scalars)
-        return minitorch.scalar.Scalar(c, back)
+        back = _ScalarHistory(cls, ctx, scalars)
+        return _Scalar(c, back)
 
 
 # Examples
 class Add(ScalarFunction):
     """Addition function $f(x, y) = x + y$"""
 
+    STATELESS_BACKWARD = True
+
     @staticmethod
     def forward(ctx: Context, a: float, b: float) -> float:
         """Addition function $f(x, y) = x + y$"""
@@ -93,14 +133,18 @@ class Log(ScalarFunction):
     @staticmethod
     def forward(ctx: Context, a: float) -> float:
         """Logarithm function $f(x) = log(x)$"""
-        ctx.save_for_backward(a)
-        return operators.log(a)
+        return Log._forward_saving_residual(ctx, a)
+
+    @staticmethod
+    def forward_residual(ctx: Context, a: float) -> Tuple[float, float]:
+        """Logarithm function $f(x) = log(x)$, with residual $1/x$"""
+        return operators.log(a), operators.inv(a)
 
     @staticmethod
     def backward(ctx: Context, d_output: float) -> float:
         """Computes the derivative of the logarithm function multiplied by a scalar"""
-        (a,) = ctx.saved_values
-        return operators.log_back(a, d_output)
+        (residual,) = ctx.saved_values
+        return residual * d_output
 
 
 class Mul(ScalarFunction):
@@ -125,19 +169,26 @@ class Inv(ScalarFunction):
     @staticmethod
     def forward(ctx: Context, a: float) -> float:
         """Inverse function $f(x) = 1/x"""
-        ctx.save_for_backward(a)
-        return operators.inv(a)
+        return Inv._forward_saving_residual(ctx, a)
+
+    @staticmethod
+    def forward_residual(ctx: Context, a: float) -> Tuple[float, float]:
+        """Inverse function $f(x) = 1/x$, with residual $-1/x^2$"""
+        out = operators.inv(a)
+        return out, -(out * out)
 
     @staticmethod
     def backward(ctx: Context, d_output: float) -> float:
         """Computes the derivative of the inverse function with respect to its input."""
-        (a,) = ctx.saved_values
-        return operators.inv_back(a, d_output)
+        (residual,) = ctx.saved_values
+        return residual * d_output
 
 
 class Neg(ScalarFunction):
     """Negative function $f(x) = -x"""
 
+    STATELESS_BACKWARD = True
+
     @staticmethod
     def forward(ctx: Context, a: float) -> float:
         """Negative function $f(x) = -x"""
@@ -155,15 +206,19 @@ class Sigmoid(ScalarFunction):
     @staticmethod
     def forward(ctx: Context, a: float) -> float:
         """Sigmoid function $f(x) = 1 / (1 + e^{-x})$"""
-        ctx.save_for_backward(a)
-        return operators.sigmoid(a)
+        return Sigmoid._forward_saving_residual(ctx, a)
+
+    @staticmethod
+    def forward_residual(ctx: Context, a: float) -> Tuple[float, float]:
+        """Sigmoid function $f(x) = 1 / (1 + e^{-x})$, with residual $f(x)(1 - f(x))$"""
+        s = operators.sigmoid(a)
+        return s, s * (1.0 - s)
 
     @staticmethod
     def backward(ctx: Context, d_output: float) -> float:
         """Computes the derivative of the sigmoid function with respect to its input."""
-        (a,) = ctx.saved_values
-        s = operators.sigmoid(a)
-        return s * (1.0 - s) * d_output
+        (residual,) = ctx.saved_values
+        return residual * d_output
 
 
 class ReLU(ScalarFunction):
@@ -188,19 +243,26 @@ class Exp(ScalarFunction):
     @staticmethod
     def forward(ctx: Context, a: float) -> float:
         """Exponential function $f(x) = e^x"""
-        ctx.save_for_backward(a)
-        return operators.exp(a)
+        return Exp._forward_saving_residual(ctx, a)
+
+    @staticmethod
+    def forward_residual(ctx: Context, a: float) -> Tuple[float, float]:
+        """Exponential function $f(x) = e^x$, which is its own residual"""
+        out = operators.exp(a)
+        return out, out
 
     @staticmethod
     def backward(ctx: Context, d_output: float) -> float:
         """Computes the derivative of the exponential function with respect to its input."""
-        (a,) = ctx.saved_values
-        return operators.exp(a) * d_output
+        (residual,) = ctx.saved_values
+        return residual * d_output
 
 
 class LT(ScalarFunction):
     """Less than function $f(x, y) = x < y"""
 
+    STATELESS_BACKWARD = True
+
     @staticmethod
     def forward(ctx: Context, a: float, b: float) -> float:
         """Less than function $f(x, y) = x < y"""
@@ -215,6 +277,8 @@ class LT(ScalarFunction):
 class GT(ScalarFunction):
     """Greater than function $f(x, y) = x > y"""
 
+    STATELESS_BACKWARD = True
+
     @staticmethod
     def forward(ctx: Context, a: float, b: float) -> float:
         """Greater than function $f(x, y) = x > y"""
@@ -229,6 +293,8 @@ class GT(ScalarFunction):
 class EQ(ScalarFunction):
     """Equality function $f(x, y) = x == y"""
 
+    STATELESS_BACKWARD = True
+
     @staticmethod
     def forward(ctx: Context, a: float, b: float) -> float:
         """Equality function $f(x, y) = x == y"""
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import random
-from typing import Iterable, Optional, Sequence, Tuple, Union
+from functools import cached_property, lru_cache
+from typing import Callable, Dict, Iterable, Optional, Sequence, Tuple, Union
 
 import numba
 import numba.cuda
@@ -10,9 +11,14 @@ import numpy.typing as npt
 from numpy import array, float64
 from typing_extensions import TypeAlias
 
+from . import _fast_indexing
 from .operators import prod
 
 MAX_DIMS = 32
+# Number of indices unravelled at a time when iterating over a tensor.
+INDEX_BLOCK = 4096
+# Most validated positions remembered per tensor by `TensorData.index`.
+POS_CACHE_SIZE = 4096
 
 
 class IndexingError(RuntimeError):
@@ -22,16 +28,23 @@ class IndexingError(RuntimeError):
 
 
 Storage: TypeAlias = npt.NDArray[np.float64]
-OutIndex: TypeAlias = npt.NDArray[np.int32]
-Index: TypeAlias = npt.NDArray[np.int32]
-Shape: TypeAlias = npt.NDArray[np.int32]
-Strides: TypeAlias = npt.NDArray[np.int32]
+OutIndex: TypeAlias = npt.NDArray[np.int64]
+Index: TypeAlias = npt.NDArray[np.int64]
+Shape: TypeAlias = npt.NDArray[np.int64]
+Strides: TypeAlias = npt.NDArray[np.int64]
 
 UserIndex: TypeAlias = Sequence[int]
 UserShape: TypeAlias = Sequence[int]
 UserStrides: TypeAlias = Sequence[int]
 
 
+def _int_array(values: Union[UserIndex, Index]) -> Index:
+    """`values` as an int64 array; arrays are passed through untouched."""
+    if isinstance(values, np.ndarray):
+        return values
+    return np.array(values, dtype=np.int64)
+
+
 def index_to_position(index: Index, strides: Strides) -> int:
     """Converts a multidimensional tensor `index` into a single-dimensional position in
     storage based on strides.
@@ -49,8 +62,7 @@ def index_to_position(index: Index, strides: Strides) -> int:
     # TODO: Implement for Task 2.1.
     if len(index) != len(strides):
         raise IndexingError(f"Index {index} must have same length as strides {strides}")
-    position = sum(index * stride for index, stride in zip(index, strides))
-    return position
+    return _fast_indexing.index_to_position(_int_array(index), _int_array(strides))
 
 
 def to_index(ordinal: int, shape: Shape, out_index: OutIndex) -> None:
@@ -67,10 +79,13 @@ def to_index(ordinal: int, shape: Shape, out_index: OutIndex) -> None:
 
     """
     # TODO: Implement for Task 2.1.
-    # Calculate strides
-    for i in range(len(shape) - 1, -1, -1):
-        out_index[i] = ordinal % shape[i]
-        ordinal = ordinal // shape[i]
+    if len(out_index) < len(shape):
+        raise IndexingError(f"Out index {out_index} is shorter than shape {shape}.")
+    # Lists are filled through an array buffer and copied back.
+    buffer = _int_array(out_index)
+    _fast_indexing.to_index(ordinal, _int_array(shape), buffer)
+    if buffer is not out_index:
+        out_index[:] = buffer.tolist()
 
     # raise NotImplementedError("Need to implement for Task 2.1") 
 
@@ -145,38 +160,21 @@ def broadcast_index(
         None
 
     """
-    # Debugging Statements
-    print("shape:", shape)
-    print("big_shape:", big_shape)
-    print("big_index:", big_index)
-    print("out_index:", out_index)
-    
-    if len(shape) == 0:
-        # If the smaller tensor is a scalar, no need to modify out_index
-        return
-    
-    pad_amount = len(big_shape) - len(shape)
-    
-    if pad_amount < 0:
-        raise ValueError("big_shape must have at least as many dimensions as shape")
-    
-    # Create padded_shape by prepending 1s to match the number of dimensions
-    padded_shape = np.concatenate((np.ones(pad_amount, dtype=shape.dtype), shape))
-    
-    # Check for broadcasting compatibility
-    for dim in range(len(big_shape)):
-        if padded_shape[dim] != 1 and padded_shape[dim] != big_shape[dim]:
-            raise ValueError(
-                f"Shapes {big_shape} and {shape} are not broadcast-compatible."
-            )
-    
-    # Map indices correctly by aligning dimensions from the right
-    for dim in range(len(shape)):
-        big_dim = dim + pad_amount
-        if padded_shape[big_dim] > 1:
-            out_index[dim] = big_index[big_dim]
-        else:
-            out_index[dim] = 0
+    # Shapes are aligned from the right; `shape_broadcast` already guarantees
+    # that every dimension of `shape` is either 1 or matches `big_shape`.
+    if (
+        len(shape) > len(big_shape)
+        or len(big_index) < len(big_shape)
+        or len(out_index) < len(shape)
+    ):
+        raise IndexingError(f"Cannot map index {big_index} of {big_shape} to {shape}.")
+    buffer = _int_array(out_index)
+    _fast_indexing.broadcast_index(
+        _int_array(big_index), _int_array(big_shape), _int_array(shape), buffer
+    )
+    if buffer is not out_index:
+        out_index[:] = buffer.tolist()
+
 
 def shape_broadcast(shape1: UserShape, shape2: UserShape) -> UserShape:
     """Broadcast two shapes to create a new union shape.
@@ -196,62 +194,65 @@ def shape_broadcast(shape1: UserShape, shape2: UserShape) -> UserShape:
 
     """
     # TODO: Implement for Task 2.2.
-
-    # check if padding needed
-    number_of_dims1 = len(shape1)
-    number_of_dims2 = len(shape2)
-
-    if number_of_dims1 != number_of_dims2:
-        dims_to_pad = abs(number_of_dims1 - number_of_dims2)
-        if number_of_dims1 < number_of_dims2:
-            shape1 = tuple(1 for _ in range(dims_to_pad)) + tuple(shape1)
-        else:
-            shape2 = tuple(1 for _ in range(dims_to_pad)) + tuple(shape2)
-
-    # check if indexing error
-    broadcasted_shape = []
-    for dim1, dim2 in zip(shape1, shape2):
-        if dim1 != dim2 and not (dim1 == 1 or dim2 == 1):
+    return _shape_broadcast(tuple(shape1), tuple(shape2))
+
+
+@lru_cache(maxsize=1024)
+def _shape_broadcast(shape1: Tuple[int, ...], shape2: Tuple[int, ...]) -> UserShape:
+    # Align from the right; missing leading dims of the shorter shape act as 1.
+    n1, n2 = len(shape1), len(shape2)
+    n = max(n1, n2)
+    off1, off2 = n - n1, n - n2
+    out = [0] * n
+    for i in range(n):
+        d1 = shape1[i - off1] if i >= off1 else 1
+        d2 = shape2[i - off2] if i >= off2 else 1
+        if d1 != d2 and d1 != 1 and d2 != 1:
             raise IndexingError(f"Cannot broadcast shapes {shape1} and {shape2}")
-        broadcasted_shape.append(max(dim1, dim2))
-    return tuple(broadcasted_shape)
-    
-    # Alternative / more elegant
-    #   # Pad shorter shape with 1s
-    # s1, s2 = shape1[::-1], shape2[::-1]
-    # max_len = max(len(s1), len(s2))
-    # s1 = s1 + (1,) * (max_len - len(s1))
-    # s2 = s2 + (1,) * (max_len - len(s2))
-
-    # # Create broadcasted shape
-    # try:
-    #     broadcasted = tuple(max(d1, d2) if d1 == 1 or d2 == 1 or d1 == d2 else 
-    #                         raise IndexingError(f"Incompatible dimensions {d1} and {d2}")
-    #                         for d1, d2 in zip(s1, s2))
-    # except IndexingError as e:
-    #     raise IndexingError(f"Cannot broadcast shapes {shape1} and {shape2}: {str(e)}")
-
-    # return broadcasted[::-1]  
-
-    # raise NotImplementedError("Need to implement for Task 2.2")
+        out[i] = d1 if d1 > d2 else d2
+    return tuple(out)
 
 
 def strides_from_shape(shape: UserShape) -> UserStrides:
     """Return a contiguous stride for a shape"""
-    layout = [1]
+    layout = [1] * len(shape)
     offset = 1
-    for s in reversed(shape):
-        layout.append(s * offset)
-        offset = s * offset
-    return tuple(reversed(layout[:-1]))
+    for i in range(len(shape) - 1, -1, -1):
+        layout[i] = offset
+        offset *= shape[i]
+    return tuple(layout)
+
+
+@lru_cache(maxsize=1024)
+def _position_function(
+    strides: Tuple[int, ...],
+) -> Callable[[Union[UserIndex, Index]], int]:
+    """Generate `index_to_position` specialized to a fixed `strides` tuple.
+
+    The strides are baked into the source as literals, so the returned function
+    is a single sum with no loop. Small indices are unpacked into locals rather
+    than subscripted term by term.
+    """
+    dims = len(strides)
+    if dims <= 4:
+        names = [f"i{d}" for d in range(dims)]
+        unpack = f"    {', '.join(names)}, = index\n" if dims else ""
+    else:
+        names = [f"index[{d}]" for d in range(dims)]
+        unpack = ""
+    terms = [n if s == 1 else f"{n} * {s}" for n, s in zip(names, strides) if s != 0]
+    src = f"def position(index):\n{unpack}    return {' + '.join(terms) or '0'}\n"
+    namespace: Dict[str, Callable[[Union[UserIndex, Index]], int]] = {}
+    exec(src, namespace)
+    return namespace["position"]
 
 
 class TensorData:
     _storage: Storage
     _strides: Strides
     _shape: Shape
-    strides: UserStrides
     shape: UserShape
+    strides: UserStrides
     dims: int
 
     def __init__(
@@ -272,14 +273,62 @@ class TensorData:
         assert isinstance(shape, tuple), "Shape must be tuple"
         if len(strides) != len(shape):
             raise IndexingError(f"Len of strides {strides} must match {shape}.")
-        self._strides = array(strides)
-        self._shape = array(shape)
+        self._strides = np.ascontiguousarray(strides, dtype=np.int64)
+        self._shape = np.ascontiguousarray(shape, dtype=np.int64)
+        self.shape = shape
         self.strides = strides
         self.dims = len(strides)
         self.size = int(prod(shape))
-        self.shape = shape
         assert len(self._storage) == self.size
 
+    @classmethod
+    def _unchecked(
+        cls,
+        storage: Storage,
+        shape_np: Shape,
+        strides_np: Strides,
+        shape: UserShape,
+        strides: UserStrides,
+        size: int,
+    ) -> TensorData:
+        """Build a `TensorData` over existing storage without re-validating.
+
+        The caller guarantees that `storage` fits the layout, that the arrays
+        and tuples describe the same contiguous int64 shape and strides, and
+        that `size` is the product of `shape`.
+        """
+        td = cls.__new__(cls)
+        td._storage = storage
+        td._shape = shape_np
+        td._strides = strides_np
+        td.shape = shape
+        td.strides = strides
+        td.dims = len(strides)
+        td.size = size
+        return td
+
+    @cached_property
+    def _pos_cache(self) -> Dict[UserIndex, int]:
+        return {}
+
+    @cached_property
+    def _scratch_idx(self) -> Index:
+        return np.empty(self.dims, dtype=np.int64)
+
+    @cached_property
+    def _pos_fn(self) -> Callable[[Union[UserIndex, Index]], int]:
+        return _position_function(self.strides)
+
+    @cached_property
+    def _is_contiguous(self) -> bool:
+        # Strides never change after construction, so decide this once.
+        last = 1e9
+        for stride in self.strides:
+            if stride > last:
+                return False
+            last = stride
+        return True
+
     def to_cuda_(self) -> None:  # pragma: no cover
         """Convert to cuda"""
         if not numba.cuda.is_cuda_array(self._storage):
@@ -293,12 +342,7 @@ class TensorData:
             bool : True if contiguous
 
         """
-        last = 1e9
-        for stride in self._strides:
-            if stride > last:
-                return False
-            last = stride
-        return True
+        return self._is_contiguous
 
     @staticmethod
     def shape_broadcast(shape_a: UserShape, shape_b: UserShape) -> UserShape:
@@ -306,8 +350,22 @@ class TensorData:
 
     def index(self, index: Union[int, UserIndex]) -> int:
         if isinstance(index, int):
-            aindex: Index = array([index])
-        else:  # if isinstance(index, tuple):
+            index = (index,)
+
+        # Positions only depend on the (immutable) strides, so a tuple that
+        # was validated once can be answered straight from the cache.
+        if isinstance(index, tuple):
+            position = self._pos_cache.get(index)
+            if position is not None:
+                return position
+
+        if isinstance(index, np.ndarray):
+            aindex: Index = index
+        elif len(index) == self.dims:
+            # Reuse one buffer instead of allocating an array per lookup.
+            aindex = self._scratch_idx
+            aindex[:] = index
+        else:
             aindex = array(index)
 
         # Pretend 0-dim shape is 1-dim shape of singleton
@@ -326,15 +384,62 @@ class TensorData:
             if ind < 0:
                 raise IndexingError(f"Negative indexing for {aindex} not supported.")
 
-        # Call fast indexing.
-        return index_to_position(array(index), self._strides)
+        # Call the position function specialized to these strides.
+        if isinstance(index, tuple):
+            position = self._pos_fn(index)
+            if len(self._pos_cache) < POS_CACHE_SIZE:
+                self._pos_cache[index] = position
+        else:
+            position = self._pos_fn(aindex)
+        return position
+
+    def _index_block(self, start: int, stop: int) -> npt.NDArray[np.int64]:
+        """Indices for ordinals `start` to `stop`, as a `(stop - start, dims)` array."""
+        if self.dims == 0:
+            return np.zeros((stop - start, 0), dtype=np.int64)
+        ordinals = np.arange(start, stop)
+        return np.stack(np.unravel_index(ordinals, self._shape), axis=1)
+
+    def _index_blocks(self) -> Iterable[npt.NDArray[np.int64]]:
+        """Every index in ordinal order, `INDEX_BLOCK` rows at a time."""
+        for start in range(0, self.size, INDEX_BLOCK):
+            yield self._index_block(start, min(start + INDEX_BLOCK, self.size))
 
     def indices(self) -> Iterable[UserIndex]:
-        lshape: Shape = array(self.shape)
-        out_index: Index = array(self.shape)
-        for i in range(self.size):
-            to_index(i, lshape, out_index)
-            yield tuple(out_index)
+        for block in self._index_blocks():
+            for row in block.tolist():
+                yield tuple(row)
+
+    def _indexed_positions(self) -> Iterable[Tuple[UserIndex, int]]:
+        """Every `(index, position)` pair, unravelling each block only once."""
+        for block in self._index_blocks():
+            positions = self.indexes_batch(block).tolist()
+            for row, position in zip(block.tolist(), positions):
+                yield tuple(row), position
+
+    def positions(self) -> npt.NDArray[np.int64]:
+        """Storage position of every index, in the same order as `indices`.
+
+        Returns
+        -------
+            Array of `size` storage positions.
+
+        """
+        return self.indexes_batch(self._index_block(0, self.size))
+
+    def indexes_batch(self, indices: npt.NDArray[np.int64]) -> npt.NDArray[np.int64]:
+        """Convert many indices to storage positions at once.
+
+        Args:
+        ----
+            indices : `(N, dims)` array of indices. Not bounds checked.
+
+        Returns:
+        -------
+            Array of `N` storage positions.
+
+        """
+        return indices @ self._strides
 
     def sample(self) -> UserIndex:
         """Get a random valid index"""
@@ -370,19 +475,20 @@ class TensorData:
         # TODO: Implement for Task 2.1.
         if order == tuple(range(len(self.shape))):
             return self
-        new_shape = tuple(self.shape[i] for i in order)
-        new_strides = tuple(self.strides[i] for i in order)
-        return TensorData(
-            self._storage,  
-            new_shape,      
-            new_strides    
+        shape, strides = self.shape, self.strides
+        return TensorData._unchecked(
+            self._storage,
+            self._shape.take(order),
+            self._strides.take(order),
+            tuple([shape[i] for i in order]),
+            tuple([strides[i] for i in order]),
+            self.size,
         )
-        
 
     def to_string(self) -> str:
         """Convert to string"""
         s = ""
-        for index in self.indices():
+        for index, position in self._indexed_positions():
             l = ""
             for i in range(len(index) - 1, -1, -1):
                 if index[i] == 0:
@@ -390,7 +496,7 @@ class TensorData:
                 else:
                     break
             s += l
-            v = self.get(index)
+            v = self._storage[position]
             s += f"{v:3.2f}"
             l = ""
             for i in range(len(index) - 1, -1, -1):
@@ -293,8 +293,8 @@ def tensor_map(
         # out_index = Index((0,) * len(out_shape))
         # in_index = Index((0,) * len(in_shape))
          # broadcasted version:
-        out_index = np.array([0] * len(out_shape), dtype=np.int32)
-        in_index = np.array([0] * len(in_shape), dtype=np.int32)
+        out_index = np.array([0] * len(out_shape), dtype=np.int64)
+        in_index = np.array([0] * len(in_shape), dtype=np.int64)
         # in_index = [0] * len(in_shape)
         
         for ordinal in range(out_size):
@@ -363,9 +363,9 @@ def tensor_zip(
         # out_index = OutIndex((0,) * len(out_shape))
         # a_index = Index((0,) * len(a_shape))
         # b_index = Index((0,) * len(b_shape))
-        out_index = np.array([0] * len(out_shape), dtype=np.int32)
-        a_index = np.array([0] * len(a_shape), dtype=np.int32)
-        b_index = np.array([0] * len(b_shape), dtype=np.int32)
+        out_index = np.array([0] * len(out_shape), dtype=np.int64)
+        a_index = np.array([0] * len(a_shape), dtype=np.int64)
+        b_index = np.array([0] * len(b_shape), dtype=np.int64)
 
         for ordinal in range(out_size):
             # Convert flat index to multi-dimensional index for output
@@ -425,7 +425,7 @@ def tensor_reduce(
             for i in range(1, total_size):
                 accumulator = fn(accumulator, a_storage[i])
             # Assign the accumulated sum to the first (and only) position
-            out_index = np.array([0], dtype=np.int32)
+            out_index = np.array([0], dtype=np.int64)
             pos = index_to_position(out_index, out_strides)
             out[pos] = accumulator
             return  # Exit after handling all-dimension reduction
@@ -439,8 +439,8 @@ def tensor_reduce(
         # out_index = OutIndex((0,) * len(out_shape))
         # a_index = Index((0,) * len(out_shape))
 
-        out_index = np.array([0] * len(out_shape), dtype=np.int32)
-        a_index = np.array([0] * len(a_shape), dtype=np.int32)
+        out_index = np.array([0] * len(out_shape), dtype=np.int64)
+        a_index = np.array([0] * len(a_shape), dtype=np.int64)
         
         for i in range(total_reductions):
             # Convert flat index to multidimensional index
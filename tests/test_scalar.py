@@ -0,0 +1,148 @@
+import math
+from typing import Type
+
+import pytest
+from hypothesis import given
+
+import minitorch
+from minitorch import Scalar, derivative_check
+
+from .strategies import assert_close, small_floats
+
+# ## Constant inputs
+
+
+@pytest.mark.task1_2
+def test_constant_calls_build_fresh_graphs() -> None:
+    a = minitorch.Mul.apply(2.0, 3.0)
+    b = minitorch.Mul.apply(2.0, 3.0)
+    assert a is not b
+    assert a.unique_id != b.unique_id
+    assert a.data == b.data == 6.0
+
+    a.backward()
+    b.backward()
+    assert b.history is not None
+    assert b.history.inputs[0].derivative == 3.0
+
+
+@pytest.mark.task1_2
+def test_constant_signed_zero() -> None:
+    assert math.copysign(1.0, minitorch.Neg.apply(0.0).data) == -1.0
+    assert math.copysign(1.0, minitorch.Neg.apply(-0.0).data) == 1.0
+
+    assert math.copysign(1.0, minitorch.Mul.apply(0.0, 1.0).data) == 1.0
+    assert math.copysign(1.0, minitorch.Mul.apply(-0.0, 1.0).data) == -1.0
+
+
+@pytest.mark.task1_2
+def test_restricted_domain_function() -> None:
+    class Sqrt1(minitorch.ScalarFunction):
+        @staticmethod
+        def forward(ctx: minitorch.Context, a: float) -> float:
+            return math.sqrt(a - 1.0)
+
+        @staticmethod
+        def backward(ctx: minitorch.Context, d_output: float) -> float:
+            return 0.0
+
+    assert Sqrt1.apply(5.0).data == 2.0
+
+
+@pytest.mark.task1_2
+def test_forward_result_coerced_to_float() -> None:
+    class Floor(minitorch.ScalarFunction):
+        @staticmethod
+        def forward(ctx: minitorch.Context, a: float) -> float:
+            return math.floor(a)
+
+        @staticmethod
+        def backward(ctx: minitorch.Context, d_output: float) -> float:
+            return 0.0
+
+    out = Floor.apply(Scalar(2.5))
+    assert type(out.data) is float and out.data == 2.0
+
+
+# ## Residual forward
+
+
+@pytest.mark.task1_2
+@pytest.mark.parametrize(
+    "fn", [minitorch.Log, minitorch.Inv, minitorch.Sigmoid, minitorch.Exp]
+)
+def test_forward_residual_matches_forward(fn: Type[minitorch.ScalarFunction]) -> None:
+    ctx = minitorch.Context()
+    out = fn.forward(ctx, 2.0)  # type: ignore
+    out_residual, residual = fn.forward_residual(minitorch.Context(), 2.0)  # type: ignore
+    assert out == out_residual
+    assert ctx.saved_values == (residual,)
+    assert_close(fn.backward(ctx, 3.0), 3.0 * residual)  # type: ignore
+
+
+@pytest.mark.task1_4
+@given(small_floats)
+def test_residual_derivatives(x: float) -> None:
+    derivative_check(lambda a: (a * a + 1.0).log(), Scalar(x))
+    derivative_check(lambda a: 1.0 / (a * a + 1.0), Scalar(x))
+    derivative_check(lambda a: a.sigmoid(), Scalar(x))
+    derivative_check(lambda a: (a / 50.0).exp(), Scalar(x))
+
+
+# ## Chain rule cache
+
+
+@pytest.mark.task1_4
+def test_backward_twice_reuses_partials() -> None:
+    calls = []
+
+    class Square(minitorch.ScalarFunction):
+        @staticmethod
+        def forward(ctx: minitorch.Context, a: float) -> float:
+            ctx.save_for_backward(a)
+            return a * a
+
+        @staticmethod
+        def backward(ctx: minitorch.Context, d_output: float) -> float:
+            calls.append(d_output)
+            (a,) = ctx.saved_values
+            return 2.0 * a * d_output
+
+    x = Scalar(3.0)
+    y = Square.apply(x) * 2.0
+    y.backward()
+    assert x.derivative == 12.0
+    assert len(calls) == 1
+
+    y.backward()
+    assert x.derivative == 24.0
+    assert len(calls) == 1
+
+    # A different incoming derivative misses the cache.
+    y.backward(0.5)
+    assert x.derivative == 30.0
+    assert len(calls) == 2
+
+
+# ## Stateless functions
+
+
+@pytest.mark.task1_4
+def test_comparison_keeps_graph_with_grad() -> None:
+    x = Scalar(1.0)
+    out = x < 2.0
+    assert out.history is not None and out.history.last_fn is minitorch.LT
+    out = out + x
+    out.backward()
+    assert x.derivative == 1.0
+
+
+@pytest.mark.task1_4
+def test_stateless_functions_share_empty_context() -> None:
+    x = Scalar(1.0)
+    a = x + 2.0
+    b = -x
+    c = x < 2.0
+    assert a.history is not None and b.history is not None and c.history is not None
+    assert a.history.ctx is b.history.ctx is c.history.ctx
+    assert a.history.ctx is not None and a.history.ctx.saved_values == ()
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from hypothesis import given
 from hypothesis.strategies import DataObject, data
@@ -89,6 +90,66 @@ def test_permute(data: DataObject) -> None:
     assert td.index(ind) == td2.index(ind)
 
 
+@pytest.mark.task2_1
+@given(tensor_data())
+def test_positions(tensor_data: TensorData) -> None:
+    """Test that positions match index for every enumerated index."""
+    positions = tensor_data.positions()
+    assert len(positions) == tensor_data.size
+    for ind, pos in zip(tensor_data.indices(), positions):
+        assert tensor_data.index(ind) == pos
+
+
+@pytest.mark.task2_1
+def test_index_to_position_length_mismatch() -> None:
+    """Test that the public helper rejects an index that does not fit the strides."""
+    strides = np.array([1, 2])
+    assert minitorch.index_to_position(np.array([1, 1]), strides) == 3
+    with pytest.raises(minitorch.IndexingError):
+        minitorch.index_to_position(np.array([1] * 8), strides)
+
+
+@pytest.mark.task2_1
+def test_indices_across_blocks() -> None:
+    """Test that enumeration is seamless across `INDEX_BLOCK` boundaries."""
+    shape = (3, minitorch.tensor_data.INDEX_BLOCK // 2 + 1)
+    tensor_data = minitorch.TensorData([0] * (shape[0] * shape[1]), shape)
+    indices = list(tensor_data.indices())
+    assert len(indices) == tensor_data.size
+    assert indices[0] == (0, 0)
+    assert indices[-1] == (2, shape[1] - 1)
+    assert len(set(indices)) == tensor_data.size
+
+
+@pytest.mark.task2_1
+def test_position_cache_bounded() -> None:
+    """Test that repeated lookups do not grow the position cache without bound."""
+    size = minitorch.tensor_data.POS_CACHE_SIZE + 10
+    tensor_data = minitorch.TensorData([0] * size, (size,))
+    for i in range(size):
+        assert tensor_data.index((i,)) == i
+    assert len(tensor_data._pos_cache) == minitorch.tensor_data.POS_CACHE_SIZE
+    assert tensor_data.index((size - 1,)) == size - 1
+
+
+@pytest.mark.task2_1
+def test_indexes_batch() -> None:
+    tensor_data = minitorch.TensorData([0] * 3 * 5, (3, 5), (1, 3))
+    indices = np.array([[0, 0], [1, 0], [2, 4]], dtype=np.int64)
+    assert tensor_data.indexes_batch(indices).tolist() == [0, 1, 14]
+
+
+@pytest.mark.task2_1
+def test_to_index_list_out_index() -> None:
+    """Test that `to_index` fills a plain list in place."""
+    out_index = [0, 0, 0]
+    minitorch.to_index(17, np.array([2, 3, 4]), out_index)  # type: ignore
+    assert out_index == [1, 1, 1]
+
+    with pytest.raises(minitorch.IndexingError):
+        minitorch.to_index(0, np.array([2, 3, 4]), np.zeros(2, dtype=np.int64))
+
+
 # ## Tasks 2.2
 
 # Check basic properties of broadcasting.
@@ -120,6 +181,23 @@ def test_shape_broadcast() -> None:
     assert c == (2, 5)
 
 
+@pytest.mark.task2_2
+def test_broadcast_index() -> None:
+    out_index = [0, 0]
+    minitorch.broadcast_index(
+        np.array([2, 1, 3]),
+        np.array([3, 2, 4]),
+        np.array([1, 4]),
+        out_index,  # type: ignore
+    )
+    assert out_index == [0, 3]
+
+    with pytest.raises(minitorch.IndexingError):
+        minitorch.broadcast_index(
+            np.array([1]), np.array([2]), np.array([1, 2]), np.zeros(2, dtype=np.int64)
+        )
+
+
 @given(tensor_data())
 def test_string(tensor_data: TensorData) -> None:
     tensor_data.to_string()